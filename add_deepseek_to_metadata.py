@@ -23,16 +23,20 @@ def add_model_to_metadata():
         with open(METADATA_PATH, 'r') as f:
             metadata = json.load(f)
     else:
-        metadata = []
+        metadata = {}
+    if isinstance(metadata, list):
+        # Older metadata files are a plain list; the app keys records by id
+        metadata = {item.setdefault('id', f"legacy-{index}"): item for index, item in enumerate(metadata)}
     
     # Check if model already exists
-    for item in metadata:
+    for item in metadata.values():
         if item.get('hash') == MODEL_CID:
             print("✅ Model already in metadata")
             return
     
     # Add model
     model_entry = {
+        'id': MODEL_CID,
         'name': MODEL_NAME,
         'hash': MODEL_CID,
         'size': 1024 * 1024 * 100,  # Approximate 100MB
@@ -41,7 +45,7 @@ def add_model_to_metadata():
         'description': 'DeepSeek 1B parameter language model for AI inference'
     }
     
-    metadata.append(model_entry)
+    metadata[model_entry['id']] = model_entry
     
     # Save metadata
     with open(METADATA_PATH, 'w') as f:
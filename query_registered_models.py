@@ -72,19 +72,23 @@ def update_streamlit_metadata(models):
         with open(metadata_file, 'r') as f:
             metadata = json.load(f)
     except:
-        metadata = []
+        metadata = {}
+    if isinstance(metadata, list):
+        # Older metadata files are a plain list; the app keys records by id
+        metadata = {item.setdefault('id', f"legacy-{index}"): item for index, item in enumerate(metadata)}
     
     # Add models if not already present
     for model in models:
-        exists = any(item.get('hash') == model['cid'] for item in metadata)
+        exists = any(item.get('hash') == model['cid'] for item in metadata.values())
         if not exists and model['cid']:
-            metadata.append({
+            metadata[model['cid']] = {
+                'id': model['cid'],
                 'name': model['name'],
                 'hash': model['cid'],
                 'type': 'model',
                 'blockchain_id': model['id'],
                 'uploaded_at': '2025-01-29T12:00:00'
-            })
+            }
     
     # Save updated metadata
     with open(metadata_file, 'w') as f:
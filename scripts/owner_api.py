@@ -81,6 +81,24 @@ class ModelStatus(BaseModel):
 # In-memory storage for model status (in production, use a database)
 model_status_db: Dict[str, ModelStatus] = {}
 
+# Cached Web3 connectivity for /health; refreshed off the event loop
+WEB3_STATUS_TTL = 10.0
+web3_status = {"connected": False, "checked_at": 0.0}
+
+async def get_web3_connected() -> bool:
+    """Return Web3 connectivity, re-checking at most once per WEB3_STATUS_TTL"""
+    if not w3:
+        return False
+    now = asyncio.get_running_loop().time()
+    if now - web3_status["checked_at"] >= WEB3_STATUS_TTL:
+        web3_status["checked_at"] = now
+        try:
+            web3_status["connected"] = await asyncio.to_thread(w3.is_connected)
+        except Exception as e:
+            logger.warning(f"Web3 health check failed: {e}")
+            web3_status["connected"] = False
+    return web3_status["connected"]
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize connections on startup"""
@@ -154,7 +172,7 @@ async def health_check():
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "services": {
-            "web3": w3.is_connected() if w3 else False,
+            "web3": await get_web3_connected(),
             "ipfs": ipfs_client is not None,
             "contract": contract is not None
         }
@@ -469,10 +487,22 @@ async def download_model(model_id: str):
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8002))
+
+    # Prefer the uvloop event loop and httptools parser when installed
+    # (uvloop is not available on Windows)
+    try:
+        import uvloop  # noqa: F401
+        import httptools  # noqa: F401
+        server_options = {"loop": "uvloop", "http": "httptools"}
+    except ImportError:
+        server_options = {}
+
     uvicorn.run(
         "owner_api:app",
         host="0.0.0.0",
         port=port,
         reload=False,
-        log_level="info"
+        log_level="info",
+        access_log=False,
+        **server_options
     )
\ No newline at end of file
@@ -0,0 +1,181 @@
+// MetaMask integration
+let walletManager = null;
+let userAccount = null;
+let userSigner = null;
+
+class StreamlitWalletManager {
+    constructor() {
+        this.chainId = '0x539'; // 1337 in hex
+        this.chainName = 'Decentralized vLLM Network';
+        this.rpcUrl = 'http://localhost:8545';
+        this.provider = null;
+        this.signer = null;
+        this.account = null;
+    }
+
+    async init() {
+        if (typeof window.ethereum !== 'undefined') {
+            this.provider = window.ethereum;
+            return true;
+        }
+        return false;
+    }
+
+    async connect() {
+        try {
+            if (!this.provider) {
+                throw new Error('MetaMask not available');
+            }
+
+            // Request account access
+            const accounts = await this.provider.request({
+                method: 'eth_requestAccounts'
+            });
+
+            if (accounts.length === 0) {
+                throw new Error('No accounts found');
+            }
+
+            // Switch to correct network
+            await this.switchToPrivateNetwork();
+
+            // Set up Web3 provider
+            const web3Provider = new ethers.providers.Web3Provider(this.provider);
+            this.signer = web3Provider.getSigner();
+            this.account = accounts[0];
+
+            // Update Streamlit
+            this.updateStreamlitWallet(this.account);
+
+            return {
+                account: this.account,
+                signer: this.signer
+            };
+
+        } catch (error) {
+            console.error('Failed to connect wallet:', error);
+            this.showError(error.message);
+            throw error;
+        }
+    }
+
+    async switchToPrivateNetwork() {
+        try {
+            await this.provider.request({
+                method: 'wallet_switchEthereumChain',
+                params: [{ chainId: this.chainId }],
+            });
+        } catch (switchError) {
+            if (switchError.code === 4902) {
+                try {
+                    await this.provider.request({
+                        method: 'wallet_addEthereumChain',
+                        params: [{
+                            chainId: this.chainId,
+                            chainName: this.chainName,
+                            rpcUrls: [this.rpcUrl],
+                            nativeCurrency: {
+                                name: 'ETH',
+                                symbol: 'ETH',
+                                decimals: 18
+                            }
+                        }]
+                    });
+                } catch (addError) {
+                    throw addError;
+                }
+            } else {
+                throw switchError;
+            }
+        }
+    }
+
+    updateStreamlitWallet(account) {
+        // Store wallet info in session state
+        window.parent.postMessage({
+            type: 'wallet_connected',
+            account: account
+        }, '*');
+        
+        // Update UI elements
+        const accountElements = document.querySelectorAll('.wallet-account');
+        accountElements.forEach(el => {
+            el.textContent = this.formatAddress(account);
+        });
+
+        const connectButtons = document.querySelectorAll('.connect-wallet-btn');
+        connectButtons.forEach(btn => {
+            btn.style.display = 'none';
+        });
+
+        const walletInfo = document.querySelectorAll('.wallet-info');
+        walletInfo.forEach(info => {
+            info.style.display = 'block';
+        });
+    }
+
+    formatAddress(address) {
+        return `${address.slice(0, 6)}...${address.slice(-4)}`;
+    }
+
+    showError(message) {
+        const errorDiv = document.createElement('div');
+        errorDiv.className = 'network-warning';
+        errorDiv.innerHTML = `⚠️ ${message}`;
+        document.body.insertBefore(errorDiv, document.body.firstChild);
+        
+        setTimeout(() => {
+            errorDiv.remove();
+        }, 5000);
+    }
+
+    async getBalance() {
+        if (!this.account || !this.provider) return '0';
+        
+        try {
+            const balance = await this.provider.request({
+                method: 'eth_getBalance',
+                params: [this.account, 'latest']
+            });
+            // BigNumber math; parseInt loses precision on wei values above 2^53
+            return ethers.utils.formatEther(balance);
+        } catch (error) {
+            console.error('Failed to get balance:', error);
+            return '0';
+        }
+    }
+}
+
+// Initialize wallet manager
+async function initWallet() {
+    walletManager = new StreamlitWalletManager();
+    const available = await walletManager.init();
+    
+    if (!available) {
+        document.getElementById('metamask-not-available').style.display = 'block';
+    }
+}
+
+// Connect wallet function
+async function connectWallet() {
+    try {
+        const result = await walletManager.connect();
+        userAccount = result.account;
+        userSigner = result.signer;
+        
+        // Update balance
+        const balance = await walletManager.getBalance();
+        document.getElementById('wallet-balance').textContent = balance + ' ETH';
+        
+        console.log('Wallet connected:', userAccount);
+    } catch (error) {
+        console.error('Connection failed:', error);
+    }
+}
+
+// Initialize on page load
+document.addEventListener('DOMContentLoaded', initWallet);
+
+// Make functions globally available
+window.connectWallet = connectWallet;
+window.walletManager = walletManager;
@@ -4,7 +4,7 @@ import json
 import os
 import yaml
 import requests
-import ipfshttpclient
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from datetime import datetime
 import pandas as pd
@@ -12,6 +12,24 @@ import plotly.express as px
 import plotly.graph_objects as go
 import math
 
+# Use orjson for faster JSON serialization when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Stream multipart uploads instead of building the whole request body in memory
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+def _json_dumps(obj, indent=False, default=None):
+    """Serialize obj to JSON bytes, compact unless indent is set"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None, default=default).encode()
+
 # Page configuration
 st.set_page_config(
     page_title="Surgent - Decentralized AI Network (MetaMask)",
@@ -72,196 +90,30 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# JavaScript for MetaMask integration
-metamask_js = """
+# JavaScript for MetaMask integration. The script lives in static/ (served by
+# Streamlit's static file serving) so browsers fetch and cache it once instead
+# of receiving it inline with every rerun. The path is relative so it also
+# resolves when server.baseUrlPath is set.
+METAMASK_HTML = """
 <script src="https://cdn.ethers.io/lib/ethers-5.7.2.umd.min.js"></script>
-<script>
-// MetaMask integration
-let walletManager = null;
-let userAccount = null;
-let userSigner = null;
-
-class StreamlitWalletManager {
-    constructor() {
-        this.chainId = '0x539'; // 1337 in hex
-        this.chainName = 'Decentralized vLLM Network';
-        this.rpcUrl = 'http://localhost:8545';
-        this.provider = null;
-        this.signer = null;
-        this.account = null;
-    }
-
-    async init() {
-        if (typeof window.ethereum !== 'undefined') {
-            this.provider = window.ethereum;
-            return true;
-        }
-        return false;
-    }
-
-    async connect() {
-        try {
-            if (!this.provider) {
-                throw new Error('MetaMask not available');
-            }
-
-            // Request account access
-            const accounts = await this.provider.request({
-                method: 'eth_requestAccounts'
-            });
-
-            if (accounts.length === 0) {
-                throw new Error('No accounts found');
-            }
-
-            // Switch to correct network
-            await this.switchToPrivateNetwork();
-
-            // Set up Web3 provider
-            const web3Provider = new ethers.providers.Web3Provider(this.provider);
-            this.signer = web3Provider.getSigner();
-            this.account = accounts[0];
-
-            // Update Streamlit
-            this.updateStreamlitWallet(this.account);
-
-            return {
-                account: this.account,
-                signer: this.signer
-            };
-
-        } catch (error) {
-            console.error('Failed to connect wallet:', error);
-            this.showError(error.message);
-            throw error;
-        }
-    }
-
-    async switchToPrivateNetwork() {
-        try {
-            await this.provider.request({
-                method: 'wallet_switchEthereumChain',
-                params: [{ chainId: this.chainId }],
-            });
-        } catch (switchError) {
-            if (switchError.code === 4902) {
-                try {
-                    await this.provider.request({
-                        method: 'wallet_addEthereumChain',
-                        params: [{
-                            chainId: this.chainId,
-                            chainName: this.chainName,
-                            rpcUrls: [this.rpcUrl],
-                            nativeCurrency: {
-                                name: 'ETH',
-                                symbol: 'ETH',
-                                decimals: 18
-                            }
-                        }]
-                    });
-                } catch (addError) {
-                    throw addError;
-                }
-            } else {
-                throw switchError;
-            }
-        }
-    }
-
-    updateStreamlitWallet(account) {
-        // Store wallet info in session state
-        window.parent.postMessage({
-            type: 'wallet_connected',
-            account: account
-        }, '*');
-        
-        // Update UI elements
-        const accountElements = document.querySelectorAll('.wallet-account');
-        accountElements.forEach(el => {
-            el.textContent = this.formatAddress(account);
-        });
-
-        const connectButtons = document.querySelectorAll('.connect-wallet-btn');
-        connectButtons.forEach(btn => {
-            btn.style.display = 'none';
-        });
-
-        const walletInfo = document.querySelectorAll('.wallet-info');
-        walletInfo.forEach(info => {
-            info.style.display = 'block';
-        });
-    }
-
-    formatAddress(address) {
-        return `${address.slice(0, 6)}...${address.slice(-4)}`;
-    }
-
-    showError(message) {
-        const errorDiv = document.createElement('div');
-        errorDiv.className = 'network-warning';
-        errorDiv.innerHTML = `⚠️ ${message}`;
-        document.body.insertBefore(errorDiv, document.body.firstChild);
-        
-        setTimeout(() => {
-            errorDiv.remove();
-        }, 5000);
-    }
-
-    async getBalance() {
-        if (!this.account || !this.provider) return '0';
-        
-        try {
-            const balance = await this.provider.request({
-                method: 'eth_getBalance',
-                params: [this.account, 'latest']
-            });
-            return (parseInt(balance, 16) / Math.pow(10, 18)).toFixed(4);
-        } catch (error) {
-            console.error('Failed to get balance:', error);
-            return '0';
-        }
-    }
-}
-
-// Initialize wallet manager
-async function initWallet() {
-    walletManager = new StreamlitWalletManager();
-    const available = await walletManager.init();
-    
-    if (!available) {
-        document.getElementById('metamask-not-available').style.display = 'block';
-    }
-}
-
-// Connect wallet function
-async function connectWallet() {
-    try {
-        const result = await walletManager.connect();
-        userAccount = result.account;
-        userSigner = result.signer;
-        
-        // Update balance
-        const balance = await walletManager.getBalance();
-        document.getElementById('wallet-balance').textContent = balance + ' ETH';
-        
-        console.log('Wallet connected:', userAccount);
-    } catch (error) {
-        console.error('Connection failed:', error);
-    }
-}
+<script src="app/static/metamask.js"></script>
+"""
 
-// Initialize on page load
-document.addEventListener('DOMContentLoaded', initWallet);
+# Config sources
+DEPLOYMENT_PATH = os.path.join(os.path.dirname(__file__), 'deployment.json')
+CONFIG_YAML_PATH = os.path.join(os.path.dirname(__file__), 'orchestrator', 'config.yaml')
 
-// Make functions globally available
-window.connectWallet = connectWallet;
-window.walletManager = walletManager;
-</script>
-"""
+def _mtime(path):
+    """Modification time of path, or 0.0 if it does not exist"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
 
-# Load configuration with MetaMask support
-@st.cache_data
-def load_config():
+# Load configuration with MetaMask support. The file mtimes are part of the
+# cache key, so editing either file reloads it; the TTL bounds env var staleness.
+@st.cache_data(ttl=300)
+def load_config(deployment_mtime, config_mtime):
     """Load configuration from environment variables and config files"""
     try:
         # Try to load from environment variables first
@@ -274,18 +126,17 @@ def load_config():
         }
         
         # Try to load deployment info
-        deployment_path = os.path.join(os.path.dirname(__file__), 'deployment.json')
-        if os.path.exists(deployment_path):
-            with open(deployment_path, 'r') as f:
+        if deployment_mtime:
+            with open(DEPLOYMENT_PATH, 'r') as f:
                 deployment = json.load(f)
                 config['contract_address'] = deployment.get('inferenceCoordinator')
                 config['model_registry_address'] = deployment.get('modelRegistry')
         
         # Try to load from config.yaml as fallback
-        config_path = os.path.join(os.path.dirname(__file__), 'orchestrator', 'config.yaml')
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                yaml_config = yaml.safe_load(f)
+        if config_mtime:
+            with open(CONFIG_YAML_PATH, 'r') as f:
+                # libyaml's C loader when PyYAML was built with it
+                yaml_config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
                 # Update with yaml config, but don't override env vars
                 for key, value in yaml_config.items():
                     if key not in config or config[key] is None:
@@ -296,6 +147,39 @@ def load_config():
         st.error(f"Failed to load config: {e}")
         return None
 
+# Contract ABI (simplified for demo), built once at import
+_CONTRACT_ABI = (
+    {
+        "inputs": [{"name": "promptCID", "type": "string"}, {"name": "modelCID", "type": "string"}],
+        "name": "submitPromptWithCID",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "jobId", "type": "uint256"},
+            {"indexed": True, "name": "controller", "type": "address"},
+            {"indexed": False, "name": "promptCID", "type": "string"},
+            {"indexed": False, "name": "modelId", "type": "string"},
+            {"indexed": False, "name": "modelCID", "type": "string"}
+        ],
+        "name": "InferenceRequested",
+        "type": "event"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "jobId", "type": "uint256"},
+            {"indexed": True, "name": "worker", "type": "address"},
+            {"indexed": False, "name": "responseCID", "type": "string"}
+        ],
+        "name": "InferenceCompleted",
+        "type": "event"
+    }
+)
+
 # Initialize Web3 connection
 @st.cache_resource
 def init_web3(config):
@@ -303,42 +187,9 @@ def init_web3(config):
     try:
         w3 = Web3(Web3.HTTPProvider(config['eth_node']))
         
-        # Load contract ABI (simplified for demo)
-        contract_abi = [
-            {
-                "inputs": [{"name": "promptCID", "type": "string"}, {"name": "modelCID", "type": "string"}],
-                "name": "submitPromptWithCID",
-                "outputs": [{"name": "", "type": "uint256"}],
-                "stateMutability": "payable",
-                "type": "function"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "name": "jobId", "type": "uint256"},
-                    {"indexed": True, "name": "controller", "type": "address"},
-                    {"name": "promptCID", "type": "string"},
-                    {"name": "modelId", "type": "string"},
-                    {"name": "modelCID", "type": "string"}
-                ],
-                "name": "InferenceRequested",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "name": "jobId", "type": "uint256"},
-                    {"indexed": True, "name": "worker", "type": "address"},
-                    {"name": "responseCID", "type": "string"}
-                ],
-                "name": "InferenceCompleted",
-                "type": "event"
-            }
-        ]
-        
         contract = w3.eth.contract(
             address=config['contract_address'],
-            abi=contract_abi
+            abi=_CONTRACT_ABI
         )
         
         return w3, contract
@@ -346,29 +197,39 @@ def init_web3(config):
         st.error(f"Failed to initialize Web3: {e}")
         return None, None
 
-# IPFS client
+# IPFS HTTP API, called directly over one keep-alive session (the same API
+# ipfshttpclient wraps, without a connect per client)
+IPFS_API_URL = f"http://{os.getenv('IPFS_HOST', '127.0.0.1')}:{os.getenv('IPFS_PORT', '5001')}/api/v0"
+
 @st.cache_resource
-def get_ipfs_client():
-    """Get IPFS client"""
-    try:
-        return ipfshttpclient.connect('/ip4/127.0.0.1/tcp/5001')
-    except Exception as e:
-        st.error(f"Failed to connect to IPFS: {e}")
-        return None
+def get_ipfs_session():
+    """HTTP session for the IPFS API, shared across reruns and sessions"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=16)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
 
 def upload_to_ipfs(content, is_json=False):
     """Upload content to IPFS"""
     try:
-        ipfs_client = get_ipfs_client()
-        if not ipfs_client:
-            return None
-        
         if is_json:
-            result = ipfs_client.add_json(content)
+            file = ('data.json', _json_dumps(content), 'application/json')
         else:
-            result = ipfs_client.add_str(content)
+            file = ('data.txt', content.encode() if isinstance(content, str) else content, 'text/plain')
         
-        return result
+        if MultipartEncoder is not None:
+            encoder = MultipartEncoder(fields={'file': file})
+            response = get_ipfs_session().post(
+                f"{IPFS_API_URL}/add",
+                data=encoder,
+                headers={'Content-Type': encoder.content_type},
+                timeout=30
+            )
+        else:
+            response = get_ipfs_session().post(f"{IPFS_API_URL}/add", files={'file': file}, timeout=30)
+        response.raise_for_status()
+        return response.json()['Hash']
     except Exception as e:
         st.error(f"Failed to upload to IPFS: {e}")
         return None
@@ -376,15 +237,14 @@ def upload_to_ipfs(content, is_json=False):
 def fetch_from_ipfs(cid):
     """Fetch content from IPFS"""
     try:
-        ipfs_client = get_ipfs_client()
-        if not ipfs_client:
-            return None
+        response = get_ipfs_session().post(f"{IPFS_API_URL}/cat", params={'arg': cid}, timeout=30)
+        response.raise_for_status()
         
         # Try to get as JSON first, then as string
         try:
-            return ipfs_client.get_json(cid)
-        except:
-            return ipfs_client.cat(cid).decode('utf-8')
+            return response.json()
+        except ValueError:
+            return response.content.decode('utf-8')
     except Exception as e:
         st.error(f"Failed to fetch from IPFS: {e}")
         return None
@@ -616,7 +476,7 @@ def main():
     """, unsafe_allow_html=True)
     
     # Inject MetaMask JavaScript
-    st.components.v1.html(metamask_js, height=0)
+    st.components.v1.html(METAMASK_HTML, height=0)
     
     # Header
     st.markdown("""
@@ -627,7 +487,7 @@ def main():
     """, unsafe_allow_html=True)
     
     # Load configuration
-    config = load_config()
+    config = load_config(_mtime(DEPLOYMENT_PATH), _mtime(CONFIG_YAML_PATH))
     if not config:
         st.stop()
     
@@ -727,19 +587,31 @@ def render_wallet_interface(w3, contract, config):
                 st.rerun()
     
     with col2:
-        st.subheader("📊 Network Status")
-        try:
-            block_number = w3.eth.block_number
-            st.success(f"✅ Connected to Ethereum (Block: {block_number})")
-        except:
-            st.error("❌ Failed to connect to Ethereum")
-        
-        # Contract info
-        if config.get('contract_address'):
-            st.info(f"📄 Contract: {config['contract_address'][:10]}...")
-        
-        # IPFS status
-        st.info("📁 IPFS: Connected")
+        render_network_status(w3, config)
+
+# Refreshes itself on a timer; other widgets on the page rerun the script
+# without repeating the block number RPC call
+@st.fragment(run_every=10)
+def render_network_status(w3, config):
+    """Render the node connection, contract and IPFS status column"""
+    st.subheader("📊 Network Status")
+    try:
+        block_number = w3.eth.block_number
+        # Only reformat when the chain has advanced. The element itself is still
+        # drawn every run; Streamlit drops elements a run doesn't emit.
+        if st.session_state.get('last_block_number') != block_number:
+            st.session_state.last_block_number = block_number
+            st.session_state.last_block_message = f"✅ Connected to Ethereum (Block: {block_number})"
+        st.success(st.session_state.last_block_message)
+    except:
+        st.error("❌ Failed to connect to Ethereum")
+    
+    # Contract info
+    if config.get('contract_address'):
+        st.info(f"📄 Contract: {config['contract_address'][:10]}...")
+    
+    # IPFS status
+    st.info("📁 IPFS: Connected")
 
 def render_chat_interface_metamask(w3, contract, config):
     """Render the chat-like interface for AI interactions with MetaMask"""
@@ -1106,13 +978,12 @@ def render_settings_metamask(config):
     system_info = {
         "Python Version": "3.9+",
         "Streamlit Version": st.__version__,
-        "Web3 Version": "6.0+",
+        "Web3 Version": "7.0+",
         "MetaMask Integration": "Enabled",
         "Platform": "Linux"
     }
     
-    for key, value in system_info.items():
-        st.text(f"{key}: {value}")
+    st.markdown("| Key | Value |\n|---|---|\n" + "\n".join(f"| {key} | {value} |" for key, value in system_info.items()))
     
     # Actions
     st.subheader("🔧 Actions")
@@ -1121,13 +992,16 @@ def render_settings_metamask(config):
     
     with col1:
         if st.button("🔄 Refresh Configuration", use_container_width=True):
-            st.cache_data.clear()
+            load_config.clear()
             st.success("Configuration refreshed!")
     
     with col2:
+        reset_connections = st.checkbox("Also reset connections", help="Reconnect to the Ethereum node and the IPFS API")
         if st.button("🧹 Clear Cache", use_container_width=True):
             st.cache_data.clear()
-            st.cache_resource.clear()
+            if reset_connections:
+                init_web3.clear()
+                get_ipfs_session.clear()
             st.success("Cache cleared!")
     
     with col3:
@@ -1142,7 +1016,7 @@ def render_settings_metamask(config):
             }
             st.download_button(
                 "Download Export",
-                json.dumps(export_data, indent=2, default=str),
+                _json_dumps(export_data, indent=True, default=str),
                 file_name=f"surgent_metamask_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json"
             )
@@ -40,7 +40,8 @@ metadata_file = Path("uploaded_files_metadata.json")
 if metadata_file.exists():
     with open(metadata_file, 'r') as f:
         metadata = json.load(f)
-    models = [m for m in metadata if m.get('type') == 'model']
+    records = metadata.values() if isinstance(metadata, dict) else metadata
+    models = [m for m in records if m.get('type') == 'model']
     for model in models:
         print(f"   - {model['name']}")
         print(f"     CID: {model['hash']}")
@@ -65,7 +65,8 @@ def check_streamlit_config():
     if metadata_file.exists():
         with open(metadata_file, 'r') as f:
             metadata = json.load(f)
-        models = [m for m in metadata if m.get('type') == 'model']
+        records = metadata.values() if isinstance(metadata, dict) else metadata
+        models = [m for m in records if m.get('type') == 'model']
         print(f"✅ Models in metadata: {len(models)}")
         for model in models:
             print(f"   - {model['name']} ({model['hash'][:16]}...)")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Decode real-shaped receipt logs with the Streamlit apps' contract ABI
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import streamlit_app  # noqa: E402
+import streamlit_app_metamask  # noqa: E402
+
+CONTRACT_ADDRESS = Web3.to_checksum_address('0x' + '11' * 20)
+CONTROLLER = Web3.to_checksum_address('0x' + '22' * 20)
+OTHER_ADDRESS = Web3.to_checksum_address('0x' + '33' * 20)
+
+
+def address_topic(address):
+    return HexBytes(b'\0' * 12 + bytes.fromhex(address[2:]))
+
+
+def receipt_log(address, topics, data, log_index):
+    """A log entry shaped like those in eth_getTransactionReceipt results"""
+    return {
+        'address': address,
+        'topics': topics,
+        'data': HexBytes(data),
+        'blockNumber': 42,
+        'blockHash': HexBytes(b'\x02' * 32),
+        'transactionHash': HexBytes(b'\x01' * 32),
+        'transactionIndex': 0,
+        'logIndex': log_index,
+        'removed': False,
+    }
+
+
+def requested_log(address, job_id, log_index=0):
+    return receipt_log(
+        address,
+        [
+            HexBytes(streamlit_app.INFERENCE_REQUESTED_TOPIC),
+            HexBytes(streamlit_app._job_topic(job_id)),
+            address_topic(CONTROLLER),
+        ],
+        encode(['string', 'string', 'string'], ['QmPrompt', 'deepseek-r1', 'QmModel']),
+        log_index,
+    )
+
+
+@pytest.fixture(params=[streamlit_app, streamlit_app_metamask], ids=['app', 'metamask'])
+def contract(request):
+    return Web3().eth.contract(address=CONTRACT_ADDRESS, abi=request.param._CONTRACT_ABI)
+
+
+def test_job_id_from_receipt_decodes_inference_requested():
+    contract = Web3().eth.contract(address=CONTRACT_ADDRESS, abi=streamlit_app._CONTRACT_ABI)
+    transfer_topic = HexBytes(Web3.keccak(text="Transfer(address,address,uint256)"))
+    receipt = {
+        'status': 1,
+        'logs': [
+            # Unrelated event and an InferenceRequested from another contract come first
+            receipt_log(CONTRACT_ADDRESS, [transfer_topic], b'', 0),
+            requested_log(OTHER_ADDRESS, 99, log_index=1),
+            requested_log(CONTRACT_ADDRESS, 7, log_index=2),
+        ],
+    }
+    assert streamlit_app.job_id_from_receipt(contract, receipt) == 7
+
+
+def test_job_id_from_receipt_without_event():
+    contract = Web3().eth.contract(address=CONTRACT_ADDRESS, abi=streamlit_app._CONTRACT_ABI)
+    assert streamlit_app.job_id_from_receipt(contract, {'status': 1, 'logs': []}) is None
+
+
+def test_inference_requested_log_decodes(contract):
+    event = contract.events.InferenceRequested().process_log(requested_log(CONTRACT_ADDRESS, 7))
+    assert event['args']['jobId'] == 7
+    assert event['args']['controller'] == CONTROLLER
+    assert event['args']['promptCID'] == 'QmPrompt'
+    assert event['args']['modelId'] == 'deepseek-r1'
+    assert event['args']['modelCID'] == 'QmModel'
+
+
+def test_inference_completed_log_decodes(contract):
+    log = receipt_log(
+        CONTRACT_ADDRESS,
+        [
+            HexBytes(streamlit_app.INFERENCE_COMPLETED_TOPIC),
+            HexBytes(streamlit_app._job_topic(7)),
+            address_topic(CONTROLLER),
+        ],
+        encode(['string'], ['QmResponse']),
+        0,
+    )
+    event = contract.events.InferenceCompleted().process_log(log)
+    assert event['args']['jobId'] == 7
+    assert event['args']['worker'] == CONTROLLER
+    assert event['args']['responseCID'] == 'QmResponse'
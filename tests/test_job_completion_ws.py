@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Drive the websocket job completion path against an in-memory provider
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+import web3
+from eth_abi import encode
+from web3 import Web3
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import streamlit_app  # noqa: E402
+
+CONTRACT_ADDRESS = Web3.to_checksum_address('0x' + '11' * 20)
+WORKER = Web3.to_checksum_address('0x' + '44' * 20)
+SUBSCRIPTION_ID = '0x' + 'ab' * 16
+
+
+def completed_log(job_id, response_cid):
+    """InferenceCompleted log as a node sends it in an eth_subscription notification"""
+    return {
+        'address': CONTRACT_ADDRESS.lower(),
+        'topics': [
+            streamlit_app.INFERENCE_COMPLETED_TOPIC,
+            streamlit_app._job_topic(job_id),
+            '0x' + '00' * 12 + WORKER[2:].lower(),
+        ],
+        'data': '0x' + encode(['string'], [response_cid]).hex(),
+        'blockNumber': '0x2a',
+        'blockHash': '0x' + '02' * 32,
+        'transactionHash': '0x' + '01' * 32,
+        'transactionIndex': '0x0',
+        'logIndex': '0x0',
+        'removed': False,
+    }
+
+
+class FakeWebSocketProvider(web3.WebSocketProvider):
+    """WebSocketProvider with the socket replaced by in-memory queues"""
+
+    # Notifications sent after the subscription is confirmed
+    notifications = []
+
+    def __init__(self, endpoint_uri, **kwargs):
+        super().__init__(endpoint_uri, **kwargs)
+        self.requests = []
+        self._incoming = None
+
+    async def is_connected(self, show_traceback=False):
+        return self._incoming is not None
+
+    async def _provider_specific_connect(self):
+        self._incoming = asyncio.Queue()
+
+    async def _provider_specific_disconnect(self):
+        self._incoming = None
+
+    async def socket_send(self, request_data):
+        request = json.loads(request_data)
+        self.requests.append(request)
+        if request['method'] == 'eth_subscribe':
+            await self._incoming.put({'jsonrpc': '2.0', 'id': request['id'], 'result': SUBSCRIPTION_ID})
+            for result in self.notifications:
+                await self._incoming.put({
+                    'jsonrpc': '2.0',
+                    'method': 'eth_subscription',
+                    'params': {'subscription': SUBSCRIPTION_ID, 'result': result},
+                })
+        else:
+            await self._incoming.put({'jsonrpc': '2.0', 'id': request['id'], 'result': None})
+
+    async def socket_recv(self):
+        return await self._incoming.get()
+
+    async def _provider_specific_socket_reader(self):
+        return await self.socket_recv()
+
+
+@pytest.fixture
+def fake_provider(monkeypatch):
+    providers = []
+
+    class Provider(FakeWebSocketProvider):
+        def __init__(self, endpoint_uri, **kwargs):
+            super().__init__(endpoint_uri, **kwargs)
+            providers.append(self)
+
+    monkeypatch.setattr(web3, 'WebSocketProvider', Provider)
+    return Provider, providers
+
+
+def contract():
+    return Web3().eth.contract(address=CONTRACT_ADDRESS, abi=streamlit_app._CONTRACT_ABI)
+
+
+def test_completion_event_is_returned(fake_provider):
+    provider_class, providers = fake_provider
+    provider_class.notifications = [completed_log(7, 'QmResponse')]
+
+    result = asyncio.run(streamlit_app.wait_for_job_completion_ws('ws://node.test', contract(), 7, timeout=5))
+
+    assert result == ('QmResponse', WORKER)
+    subscribe = next(r for r in providers[0].requests if r['method'] == 'eth_subscribe')
+    assert subscribe['params'] == [
+        'logs',
+        {
+            'address': CONTRACT_ADDRESS,
+            'topics': [streamlit_app.INFERENCE_COMPLETED_TOPIC, streamlit_app._job_topic(7)],
+        },
+    ]
+
+
+def test_timeout_without_completion(fake_provider):
+    provider_class, _ = fake_provider
+    provider_class.notifications = []
+
+    result = asyncio.run(streamlit_app.wait_for_job_completion_ws('ws://node.test', contract(), 7, timeout=0.2))
+
+    assert result == (None, None)
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Tell offline-fallback mock CIDs apart from real IPFS CIDs
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import streamlit_app  # noqa: E402
+
+
+def test_mock_cids_are_detected():
+    assert streamlit_app.is_mock_cid(streamlit_app._mock_cid(b'model weights'))
+    assert streamlit_app.is_mock_cid(streamlit_app._mock_cid(b'model weights', prefix="QmDemo", length=38))
+
+
+def test_real_cids_are_not_mock():
+    assert not streamlit_app.is_mock_cid('QmVyvJ3BUuz1KiFidCHCKN2ZNJkt2dNWREYuyn4AJSnu6Q')
+    assert not streamlit_app.is_mock_cid('bafybeigdyrzt5sfp7udm7hu76uh7y26nf3efuylqabf3oclgtqy55fbzdi')
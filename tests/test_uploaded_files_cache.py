@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Cached views of the uploaded file metadata pick up writes made outside the app
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import streamlit_app  # noqa: E402
+
+
+def record(name, file_type, size=1024):
+    return {
+        'id': f'Qm{name}',
+        'name': name,
+        'hash': f'Qm{name}',
+        'size': size,
+        'mime_type': 'application/octet-stream',
+        'uploaded_at': '2026-10-17T12:00:00',
+        'type': file_type,
+    }
+
+
+@pytest.fixture
+def metadata_path(tmp_path, monkeypatch):
+    path = tmp_path / 'uploaded_files_metadata.json'
+    monkeypatch.setattr(streamlit_app, 'UPLOADED_FILES_METADATA_PATH', path)
+    streamlit_app.st.cache_data.clear()
+    streamlit_app._uploaded_files_parse_cache.clear()
+    yield path
+    streamlit_app.st.cache_data.clear()
+    streamlit_app._uploaded_files_parse_cache.clear()
+
+
+def write_outside(path, records, mtime_ns):
+    """Write the metadata file the way the helper scripts do, with a distinct mtime"""
+    path.write_text(json.dumps({r['id']: r for r in records}))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_partition_files_sees_outside_write(metadata_path):
+    write_outside(metadata_path, [record('model.bin', 'model')], 1_000_000_000)
+    models, other_files = streamlit_app.partition_files(streamlit_app._mtime_ns(metadata_path))
+    assert [f['name'] for f in models] == ['model.bin']
+    assert other_files == []
+
+    write_outside(metadata_path, [record('model.bin', 'model'), record('notes.txt', 'file')], 2_000_000_000)
+    models, other_files = streamlit_app.partition_files(streamlit_app._mtime_ns(metadata_path))
+    assert [f['name'] for f in models] == ['model.bin']
+    assert [f['name'] for f in other_files] == ['notes.txt']
+
+
+def test_storage_info_sees_outside_write(metadata_path):
+    write_outside(metadata_path, [record('model.bin', 'model', size=1024)], 1_000_000_000)
+    info = streamlit_app.get_real_storage_info(streamlit_app._mtime_ns(metadata_path))
+    assert (info['file_count'], info['used_space']) == (1, 1024)
+
+    write_outside(metadata_path, [record('model.bin', 'model', size=1024), record('notes.txt', 'file', size=512)], 2_000_000_000)
+    info = streamlit_app.get_real_storage_info(streamlit_app._mtime_ns(metadata_path))
+    assert (info['file_count'], info['used_space']) == (2, 1536)
+    assert info['available_space'] == info['total_space'] - 1536
+
+
+def test_upload_time_is_display_only(metadata_path):
+    write_outside(metadata_path, [record('model.bin', 'model')], 1_000_000_000)
+    models, _ = streamlit_app.partition_files(streamlit_app._mtime_ns(metadata_path))
+    assert models[0]['uploaded_at_str'] == '2026-10-17 12:00:00'
+    # The records that get saved and exported do not carry the display string
+    assert 'uploaded_at_str' not in streamlit_app.load_uploaded_files_metadata()['Qmmodel.bin']
+
+
+def test_legacy_records_sharing_a_hash_are_kept(metadata_path):
+    legacy = [
+        {'name': 'a.txt', 'hash': 'QmSame', 'size': 1, 'uploaded_at': '2026-10-17T12:00:00'},
+        {'name': 'b.txt', 'hash': 'QmSame', 'size': 1, 'uploaded_at': '2026-10-17T12:00:00'},
+    ]
+    metadata_path.write_text(json.dumps(legacy))
+    metadata = streamlit_app.load_uploaded_files_metadata()
+    assert sorted(f['name'] for f in metadata.values()) == ['a.txt', 'b.txt']
+    # Ids survive a save and reload unchanged
+    streamlit_app.save_uploaded_files_metadata(metadata)
+    assert streamlit_app.load_uploaded_files_metadata().keys() == metadata.keys()